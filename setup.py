@@ -0,0 +1,27 @@
+"""setup.py
+
+The package metadata lives in pyproject.toml, this file only adds the
+optional Cython build of the hot conversion code. When Cython or a C compiler
+is not available the package is installed as plain Python.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    EXT_MODULES = []
+else:
+    EXT_MODULES = cythonize(
+        ["wp2hugo/commands.py"],
+        compiler_directives={"language_level": 3},
+    )
+    for extension in EXT_MODULES:
+        extension.optional = True
+
+setup(
+    ext_modules=EXT_MODULES,
+    # Ship the Cython declarations, not the C source cythonize generates
+    package_data={"wp2hugo": ["*.pxd"]},
+    exclude_package_data={"wp2hugo": ["*.c"]},
+)
@@ -0,0 +1,6 @@
+# commands.pxd
+#
+# Cython declarations augmenting commands.py when setup.py compiles it, the
+# module itself stays importable as plain Python.
+
+cpdef str make_safe_yaml_value(str input_string)
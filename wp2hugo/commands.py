@@ -2,14 +2,31 @@
  file to MD files usable by Hugo.
  """
 
+import os
 import re
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from xml.etree import ElementTree as ET
+from typing import Iterable
 
 import click
-from markdownify import markdownify
+from markdownify import MarkdownConverter
+
+try:
+    from lxml import etree as ET
+
+    HAS_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as ET
+
+    HAS_LXML = False
 
 NAMESPACES = {
     "content": "http://purl.org/rss/1.0/modules/content/",
@@ -20,8 +37,98 @@ NAMESPACES = {
 }
 
 
+# Clark notation prefixes of NAMESPACES, tags built from these are matched
+# as is without resolving a namespace prefix on every lookup
+WP = "{http://wordpress.org/export/1.2/}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+
+# Children of an <item> element read by Post.from_element
+WP_POST_ID = WP + "post_id"
+WP_POST_NAME = WP + "post_name"
+WP_POST_DATE = WP + "post_date"
+WP_POST_MODIFIED = WP + "post_modified"
+WP_POST_TYPE = WP + "post_type"
+WP_STATUS = WP + "status"
+DC_CREATOR = DC + "creator"
+CONTENT_ENCODED = CONTENT + "encoded"
+
+# Elements handled while streaming through the WXR file, the wp:author, wp:tag
+# and wp:category elements are direct children of <channel>
+WP_AUTHOR = WP + "author"
+WP_TAG = WP + "tag"
+WP_CATEGORY = WP + "category"
+STREAM_TAGS = ("channel", "item", WP_AUTHOR, WP_TAG, WP_CATEGORY)
+
+# Children of a wp:author element
+WP_AUTHOR_LOGIN = WP + "author_login"
+WP_AUTHOR_DISPLAY_NAME = WP + "author_display_name"
+
+# How WordPress exports a date that was never set
+WP_ZERO_DATE = "0000-00-00 00:00:00"
+
+# Characters that require a YAML value to be quoted
+YAML_SPECIAL_CHARS = frozenset(":{}[],*&!%@")
+
+# Shared by every post, the converter caches its per tag conversion functions
+MARKDOWN_CONVERTER = MarkdownConverter()
+BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+# Number of items handed to a worker process at a time
+ITEMS_PER_TASK = 16
+
+# Threads per worker process writing MD files while the next post is converted
+WRITER_THREADS = 2
+
+# Large enough to write most posts with a single syscall, small enough to stay
+# clear of the allocator's mmap threshold
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+# Parser for the <item> elements re-parsed in the worker processes of create,
+# set up like the lxml parser of iterparse_wxr. The ElementTree fallback uses
+# its default parser.
+if HAS_LXML:
+    ITEM_PARSER = ET.XMLParser(huge_tree=True, resolve_entities=False, no_network=True)
+else:
+    ITEM_PARSER = None
+
+
+def iterparse_wxr(input_file):
+    """Returns an iterator of (event, element) tuples for a WXR file
+
+    With lxml only the elements listed in STREAM_TAGS are reported, the
+    ElementTree fallback reports every element and leaves it to the caller
+    to skip the ones it does not need.
+
+    Parameters
+    ----------
+    input_file : file
+        The opened WXR file to parse
+
+    Returns
+    -------
+    iterator
+        An iterator yielding ("start" | "end", element) tuples
+    """
+
+    if HAS_LXML:
+        # Like ElementTree, never expand external entities or hit the network,
+        # which lxml before 5.0 does by default
+        # pylint: disable-next=unexpected-keyword-arg
+        return ET.iterparse(
+            input_file,
+            events=("start", "end"),
+            tag=STREAM_TAGS,
+            huge_tree=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+    return ET.iterparse(input_file, events=("start", "end"))
+
+
 @click.command()
-@click.argument("xmlfile", type=click.File("r"), required=True)
+@click.argument("xmlfile", type=click.File("rb"), required=True)
 @click.argument("outdir", default="./out", type=click.Path())
 @click.option(
     "-l",
@@ -31,7 +138,14 @@ NAMESPACES = {
     default=False,
     show_default=True,
 )
-def create(xmlfile, outdir, lowercasetags):
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help="Number of worker processes, defaults to the number of CPUs",
+    default=None,
+)
+def create(xmlfile, outdir, lowercasetags, jobs):
     """Opens the WXR XML and creates exported MD files
 
     Parameters
@@ -42,9 +156,20 @@ def create(xmlfile, outdir, lowercasetags):
         The path where the created MD files will be stored
     lowercasetags : bool
         Whether or not to lowercase the tags found in the XML file
+    jobs : int
+        The number of worker processes converting posts
     """
 
-    blog = Blog.from_file(xmlfile, lowercasetags)
+    # Items are converted in worker processes, so only keep them serialized,
+    # along with the post ID to report errors with
+    blog = Blog.from_file(
+        xmlfile,
+        lowercasetags,
+        on_item=lambda element, authors: (
+            element.findtext(WP_POST_ID),
+            ET.tostring(element),
+        ),
+    )
 
     out_dir = Path(outdir)
     out_dir = out_dir / blog.title
@@ -52,29 +177,35 @@ def create(xmlfile, outdir, lowercasetags):
     posts_dir = out_dir / "posts"
     posts_dir.mkdir(exist_ok=True, parents=True)
 
+    # Only created by the workers once a draft turns up
     drafts_dir = out_dir / "drafts"
-    drafts_dir.mkdir(exist_ok=True, parents=True)
 
-    for post in blog.posts:
-        if post.is_draft:
-            file = drafts_dir / f"{post.id}.md"
-        else:
-            file = posts_dir / f"{post.date.date()}-{post.name}.md"
-
-        file.write_text(post.to_md())
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(blog.authors, lowercasetags, posts_dir, drafts_dir),
+    ) as executor:
+        # Keep a couple of batches queued per worker, reading the file only as
+        # fast as the workers convert it
+        run_bounded(
+            executor,
+            _convert_and_write,
+            iter_batches(blog.posts, ITEMS_PER_TASK),
+            2 * (jobs or os.cpu_count() or 1),
+        )
 
 
 @click.command()
-@click.argument("xmlfile", type=click.File("r"), required=1)
+@click.argument("xmlfile", type=click.File("rb"), required=1)
 @click.option(
     "-l",
     "--lowercasetags",
     is_flag=True,
-    help="Use lower case tags from export?",
+    help="Deprecated, has no effect on stats",
     default=False,
     show_default=True,
 )
-def stats(xmlfile, lowercasetags):
+def stats(xmlfile, lowercasetags):  # pylint: disable=unused-argument
     """Opens the WXR XML and dumps some statistics
 
     Parameters
@@ -82,10 +213,10 @@ def stats(xmlfile, lowercasetags):
     xmlfile : path
         The path to the XML file to parse
     lowercasetags : bool
-        Whether or not to lowercase the tags found in the XML file
+        Deprecated and unused, stats does not convert any posts
     """
 
-    blog_info = Blog.from_file(xmlfile, lowercasetags)
+    blog_info = Blog.stats_from_file(xmlfile)
 
     click.echo(f"Title: {blog_info.title}")
     click.echo(f"Description: {blog_info.description}")
@@ -96,31 +227,167 @@ def stats(xmlfile, lowercasetags):
     click.echo(f"Number of categories found: {blog_info.number_of_categories}")
 
 
-def get_display_name_by_login(author_login, xml_data):
-    """Returns the name of the author based on the author login string
+# State shared by all the items converted in a worker process of create
+_worker_state = {}
+
+
+def _init_worker(authors, lowercasetags, posts_dir, drafts_dir):
+    """Stores the state needed by _convert_and_write in a worker process"""
+
+    _worker_state["authors"] = authors
+    _worker_state["lowercasetags"] = lowercasetags
+    _worker_state["posts_prefix"] = f"{posts_dir}{os.sep}"
+    _worker_state["drafts_prefix"] = f"{drafts_dir}{os.sep}"
+    _worker_state["drafts_dir_ready"] = False
+    _worker_state["writer"] = ThreadPoolExecutor(max_workers=WRITER_THREADS)
+
+
+def _convert_and_write(items):
+    """Converts serialized WXR items to posts and writes their MD files
+
+    The files are written by the writer threads of the worker process, so a
+    post is written while the next one is converted. All writes are done
+    before returning, raising the first error encountered.
+
+    Parameters
+    ----------
+    items : list
+        (post ID, <item> element serialized by ElementTree.tostring) tuples
+
+    Raises
+    ------
+    click.ClickException
+        If an item cannot be parsed. Unlike lxml's errors, this can be
+        pickled back to the main process.
+    """
+
+    writes = []
+    for post_id, item in items:
+        try:
+            element = ET.fromstring(item, ITEM_PARSER)
+        except ET.ParseError as error:
+            raise click.ClickException(
+                f"Could not parse post {post_id}: {error}"
+            ) from error
+        post = Post.from_element(
+            element,
+            _worker_state["lowercasetags"],
+            _worker_state["authors"],
+        )
+        if post.is_draft and not _worker_state["drafts_dir_ready"]:
+            # Other workers may be creating it at the same time
+            os.makedirs(_worker_state["drafts_prefix"], exist_ok=True)
+            _worker_state["drafts_dir_ready"] = True
+        file = post_path(
+            post, _worker_state["posts_prefix"], _worker_state["drafts_prefix"]
+        )
+        writes.append(_worker_state["writer"].submit(post.write_md, file))
+
+    for write in writes:
+        write.result()
+
+
+def run_bounded(executor, function, iterable, max_pending):
+    """Calls function with every value of iterable in executor
+
+    Unlike Executor.map, which submits every call up front, at most
+    max_pending calls are submitted ahead so a lazy iterable is only consumed
+    as fast as the executor gets through it.
+
+    Parameters
+    ----------
+    executor : Executor
+        The executor to run the calls in
+    function : callable
+        The function to call, its return values are discarded
+    iterable : iterable
+        The values to call function with
+    max_pending : int
+        The maximum number of calls submitted but not finished yet
+    """
+
+    pending = set()
+    for value in iterable:
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        pending.add(executor.submit(function, value))
+
+    for future in pending:
+        future.result()
+
+
+def iter_batches(iterable, size):
+    """Yields lists of up to size consecutive values from iterable
+
+    Parameters
+    ----------
+    iterable : iterable
+        The values to batch
+    size : int
+        The maximum number of values in a batch
+
+    Returns
+    -------
+    iterator
+        An iterator yielding the batches as lists
+    """
+
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def post_path(post, posts_prefix, drafts_prefix):
+    """Returns the path of the MD file for a post
+
+    The path is formatted as a string rather than joined as Path objects, as
+    this is done for every post.
 
     Parameters
     ----------
-    author_login : str
-        The author login name as found when parsing post object
-    xml_data : str
-        The XML data with all the authors found in the WXR file
+    post : Post
+        The post to get the file path for
+    posts_prefix : str
+        The directory holding published posts, ending in a path separator
+    drafts_prefix : str
+        The directory holding drafts, ending in a path separator
 
     Returns
     -------
     str
-        The name of the author if found, None if not found
+        The path to write the MD file of the post to
     """
 
-    root = ET.fromstring(xml_data)
-    xpath_expression = (
-        f".//wp:author[wp:author_login='{author_login}']/wp:author_display_name"
-    )
-    display_name_element = root.find(xpath_expression, NAMESPACES)
+    if post.is_draft:
+        return f"{drafts_prefix}{post.id}.md"
+    return f"{posts_prefix}{post.date.date().isoformat()}-{post.name}.md"
+
+
+def parse_wp_date(date_string):
+    """Returns the datetime for a WXR date string
+
+    WordPress writes unset dates as "0000-00-00 00:00:00", those are caught up
+    front so they do not go through an exception.
+
+    Parameters
+    ----------
+    date_string : str
+        A date as found in the WXR file, like "2023-11-23 12:34:56"
+
+    Returns
+    -------
+    datetime
+        The parsed date, None if the date is unset or malformed
+    """
 
-    if display_name_element is not None:
-        return display_name_element.text
-    return None
+    if not date_string or date_string == WP_ZERO_DATE:
+        return None
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        return None
 
 
 def make_safe_yaml_value(input_string):
@@ -138,7 +405,7 @@ def make_safe_yaml_value(input_string):
     """
 
     # Check if quoting is necessary
-    if any(char in input_string for char in ":{}[],*&!%@"):
+    if not YAML_SPECIAL_CHARS.isdisjoint(input_string):
         # Use double quotes if the string contains single quotes
         if "'" in input_string:
             return f'"{input_string}"'
@@ -165,8 +432,10 @@ class Blog:
             Number of tags found in the WXR file
         number_of_categories : int
             Number of categories found in the WXR file
-        posts : list
-            A list object with all the posts found in the WXR file
+        posts : iterable
+            The posts found in the WXR file, read lazily by from_file
+        authors : dict
+            The author display names found in the WXR file, keyed on login
     """
 
     title: str
@@ -176,55 +445,127 @@ class Blog:
     number_of_pages: int
     number_of_tags: int
     number_of_categories: int
-    posts: list
+    posts: Iterable
+    authors: dict
 
     @classmethod
-    def from_file(cls, input_file: Path, lowercasetags):
-        """Create a Blog object from a WXR file"""
-        tree = ET.parse(input_file)
+    def from_file(cls, input_file: Path, lowercasetags, on_item=None):
+        """Create a Blog object from a WXR file
 
-        # The root of WXR is an <rss> element, followed by a <channel> element
-        channel = tree.getroot().find("channel")
+        Only the start of the file is read here, posts is a generator reading
+        and converting the items as it is consumed. The counts are complete
+        once posts is exhausted.
 
-        title = channel.find("title").text
-        description = channel.find("description").text
-        url = channel.find("link").text
+        When given, on_item(element, authors) is called for every post and
+        page item instead of Post.from_element, and its results make up posts.
+        """
+        if on_item is None:
 
-        tmp_authors = channel.findall("wp:author", NAMESPACES)
-        merged_root = ET.Element("root")
-        for element in tmp_authors:
-            merged_root.append(element)
+            def on_item(element, authors):
+                return Post.from_element(element, lowercasetags, authors)
 
-        # merged_tree = ET.ElementTree(merged_root)
-        merged_xml_string = ET.tostring(merged_root, encoding="utf-8").decode("utf-8")
-        authors = merged_xml_string
+        blog, items = cls._open(input_file)
+        blog.posts = (on_item(element, blog.authors) for element in items)
+        return blog
 
-        number_of_posts = len(
-            channel.findall(".//item[wp:post_type='post']", NAMESPACES)
-        )
-        number_of_pages = len(
-            channel.findall(".//item[wp:post_type='page']", NAMESPACES)
-        )
-        number_of_tags = len(channel.findall(".//wp:tag", NAMESPACES))
-        number_of_categories = len(channel.findall(".//wp:category", NAMESPACES))
+    @classmethod
+    def stats_from_file(cls, input_file: Path):
+        """Create a Blog object from a WXR file without converting any posts
 
-        posts = [
-            Post.from_element(e, lowercasetags, authors)
-            for e in channel.findall("item")
-            if e.find("wp:post_type", NAMESPACES).text in ["post", "page"]
-        ]
+        The whole file is read to count the posts, pages, tags and categories,
+        posts is left empty.
+        """
+        blog, items = cls._open(input_file)
+        for _ in items:
+            pass
+        return blog
 
-        return cls(
-            title=title,
-            description=description,
-            url=url,
-            posts=posts,
-            number_of_posts=number_of_posts,
-            number_of_pages=number_of_pages,
-            number_of_tags=number_of_tags,
-            number_of_categories=number_of_categories,
+    @classmethod
+    def _open(cls, input_file):
+        """Reads a WXR file up to its first item
+
+        WXR lists the channel metadata and the authors ahead of the items, so
+        those are known once the first <item> starts.
+
+        Returns
+        -------
+        tuple
+            The Blog and an iterator over the rest of its post and page items
+        """
+        blog = cls(
+            title=None,
+            description=None,
+            url=None,
+            number_of_posts=0,
+            number_of_pages=0,
+            number_of_tags=0,
+            number_of_categories=0,
+            posts=[],
+            authors={},
         )
 
+        # The root of WXR is an <rss> element, followed by a <channel> element
+        events = iterparse_wxr(input_file)
+        channel = None
+        for event, element in events:
+            if event == "start":
+                if element.tag == "channel":
+                    channel = element
+                elif element.tag == "item":
+                    break
+            elif blog._read_element(element):
+                element.clear()
+                channel.remove(element)
+
+        blog.title = channel.find("title").text
+        blog.description = channel.find("description").text
+        blog.url = channel.find("link").text
+
+        return blog, blog._iter_items(events, channel)
+
+    def _iter_items(self, events, channel):
+        """Yields the post and page <item> elements left in events
+
+        Elements are dropped from the tree once they are done with, for the
+        items that is when the next one is asked for.
+        """
+        for event, element in events:
+            if event == "start":
+                continue
+
+            if element.tag == "item":
+                post_type = element.find(WP_POST_TYPE).text
+                if post_type == "post":
+                    self.number_of_posts += 1
+                    yield element
+                elif post_type == "page":
+                    self.number_of_pages += 1
+                    yield element
+            elif not self._read_element(element):
+                continue
+
+            element.clear()
+            channel.remove(element)
+
+    def _read_element(self, element):
+        """Records a wp:author, wp:tag or wp:category element
+
+        Returns
+        -------
+        bool
+            True if the element was one of those, False otherwise
+        """
+        if element.tag == WP_AUTHOR:
+            login = element.findtext(WP_AUTHOR_LOGIN)
+            self.authors[login] = element.findtext(WP_AUTHOR_DISPLAY_NAME)
+        elif element.tag == WP_TAG:
+            self.number_of_tags += 1
+        elif element.tag == WP_CATEGORY:
+            self.number_of_categories += 1
+        else:
+            return False
+        return True
+
 
 @dataclass
 class Post:
@@ -277,50 +618,54 @@ class Post:
     DATE_IN_BODY_FORMAT = "%a %d %b %Y, %I:%M"
 
     @classmethod
-    def from_element(cls, element: ET.Element, use_tag_nicename, authors):
-        """Create a post from an XML element"""
-        title = element.find("title").text
+    def from_element(cls, element: ET.Element, use_tag_nicename, authors: dict):
+        """Create a post from an XML element
+
+        The authors argument maps author login names to display names.
+        """
+        # Walk the children once instead of searching them for every field
+        fields = {}
+        category_elements = []
+        tag_elements = []
+        for child in element:
+            if child.tag == "category":
+                domain = child.get("domain")
+                if domain == "category":
+                    category_elements.append(child)
+                elif domain == "post_tag":
+                    tag_elements.append(child)
+            elif child.tag not in fields:
+                fields[child.tag] = child
+
+        title = fields["title"].text
         title = make_safe_yaml_value(title)
 
-        name = element.find("wp:post_name", NAMESPACES).text
-        creator = element.find("dc:creator", NAMESPACES).text
-        author = get_display_name_by_login(creator, authors)
+        name = fields[WP_POST_NAME].text
+        creator = fields[DC_CREATOR].text
+        author = authors.get(creator)
 
-        post_id = element.find("wp:post_id", NAMESPACES).text
-        content = element.find("content:encoded", NAMESPACES).text
+        post_id = fields[WP_POST_ID].text
+        # lxml reports an empty CDATA section as "" where ElementTree gives None
+        content = fields[CONTENT_ENCODED].text or None
         if content is not None:
-            content = markdownify(content)
-            content = re.sub(r"\n\s*\n", "\n\n", content)
-        try:
-            date = datetime.fromisoformat(element.find("wp:post_date", NAMESPACES).text)
-            datestr = f'"{date}"'
-        except ValueError:
-            date = None
+            content = MARKDOWN_CONVERTER.convert(content)
+            content = BLANK_LINES_RE.sub("\n\n", content)
+        date = parse_wp_date(fields[WP_POST_DATE].text)
+        datestr = f'"{date}"' if date is not None else ""
 
-        try:
-            modified = datetime.fromisoformat(
-                element.find("wp:post_modified", NAMESPACES).text
-            )
-            modifiedstr = f'"{modified}"'
-        except ValueError:
-            modified = None
+        modified = parse_wp_date(fields[WP_POST_MODIFIED].text)
+        modifiedstr = f'"{modified}"' if modified is not None else ""
 
-        categories = [e.text for e in element.findall("category[@domain='category']")]
-        categories = "\n".join("  -" + " " + x for x in categories)
+        categories = "\n".join(f"  - {e.text}" for e in category_elements)
 
         if use_tag_nicename:
-            tags = [
-                e.get("nicename")
-                for e in element.findall("category[@domain='post_tag']")
-            ]
-            tags = "\n".join("  -" + " " + x for x in tags)
+            tags = "\n".join(f"  - {e.get('nicename')}" for e in tag_elements)
         else:
-            tags = [e.text for e in element.findall("category[@domain='post_tag']")]
-            tags = "\n".join("  -" + " " + x for x in tags)
+            tags = "\n".join(f"  - {e.text}" for e in tag_elements)
 
-        post_type = element.find("wp:post_type", NAMESPACES).text
+        post_type = fields[WP_POST_TYPE].text
 
-        is_draft = element.find("wp:status", NAMESPACES).text == "draft"
+        is_draft = fields[WP_STATUS].text == "draft"
 
         return cls(
             title=title,
@@ -338,44 +683,63 @@ class Post:
             is_draft=is_draft,
         )
 
-    def md_frontmatter(self) -> str:
-        """Generate YAML metadata lines to be included in the markdown string"""
+    def iter_frontmatter_lines(self):
+        """Yield the YAML metadata lines, each terminated by a newline"""
 
-        lines = []
-        lines.append("---")
-        lines.append(f"id: {self.id}")
-        lines.append("layout: post")
-        lines.append(f"title: {self.title}")
-        lines.append(f"author: {self.author}")
-        lines.append(f"date: {self.datestr}")
-        lines.append(f"modified: {self.modifiedstr}")
+        yield "---\n"
+        yield f"id: {self.id}\n"
+        yield "layout: post\n"
+        yield f"title: {self.title}\n"
+        yield f"author: {self.author}\n"
+        yield f"date: {self.datestr}\n"
+        yield f"modified: {self.modifiedstr}\n"
         if len(self.categories) > 0:
-            lines.append(f"categories:\n{self.categories}")
+            yield f"categories:\n{self.categories}\n"
         if len(self.tags) > 0:
-            lines.append(f"tags:\n{self.tags}")
+            yield f"tags:\n{self.tags}\n"
         if self.is_draft:
-            lines.append("draft: true")
-        lines.append("---")
-        lines.append("")
-        return "\n".join(lines)
+            yield "draft: true\n"
+        yield "---\n"
 
-    def md_body(self, include_title=False, include_date=False) -> str:
-        """Generate markdown text body lines"""
-        lines = []
+    def iter_body_lines(self, include_title=False, include_date=False):
+        """Yield the markdown text body lines, each terminated by a newline
+
+        Parts are separated by a blank line, there is none after the last one.
+        """
+        parts = []
         if self.title is not None and include_title:
-            lines.append(f"# {self.title}")
-            lines.append("")
+            parts.append(f"# {self.title}")
         if self.date is not None and include_date:
-            lines.append(f"_{self.date.strftime(self.DATE_IN_BODY_FORMAT)}_")
-            lines.append("")
+            parts.append(f"_{self.date.strftime(self.DATE_IN_BODY_FORMAT)}_")
         if self.content is not None:
-            lines.append(f"{self.content}")
-            lines.append("")
-        return "\n".join(lines)
+            parts.append(self.content)
+
+        for index, part in enumerate(parts):
+            if index > 0:
+                yield "\n"
+            yield f"{part}\n"
+
+    def md_frontmatter(self) -> str:
+        """Generate YAML metadata lines to be included in the markdown string"""
+        return "".join(self.iter_frontmatter_lines())
+
+    def md_body(self, include_title=False, include_date=False) -> str:
+        """Generate markdown text body lines"""
+        return "".join(self.iter_body_lines(include_title, include_date))
 
     def to_md(self) -> str:
         """Convert post into a markdown string"""
-        md = ""
-        md += self.md_frontmatter()
-        md += self.md_body()
-        return md
+        return self.md_frontmatter() + self.md_body()
+
+    def write_md(self, path):
+        """Write the post as markdown to path without building the whole string
+
+        Parameters
+        ----------
+        path : path
+            The path of the MD file to create
+        """
+
+        with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as file:
+            file.writelines(self.iter_frontmatter_lines())
+            file.writelines(self.iter_body_lines())